@@ -0,0 +1,298 @@
+import requests
+import os
+import csv
+import re
+import sys
+from dotenv import load_dotenv
+from datetime import datetime
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
+
+# orjson parses response bytes much faster; fall back to the stdlib when absent
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Load environment variables from .env
+load_dotenv()
+
+# Jira credentials from environment
+JIRA_DOMAIN = os.getenv('JIRA_DOMAIN')
+JIRA_EMAIL = os.getenv('JIRA_EMAIL')
+JIRA_API_TOKEN = os.getenv('JIRA_API_TOKEN')
+
+# API headers
+HEADERS = {
+    'Accept': 'application/json'
+}
+
+# Number of projects fetched concurrently. Each project walks one search cursor,
+# so this is also the most Jira requests ever in flight at once.
+MAX_WORKERS = 8
+
+# Shared pooled session: keep-alive connections reused by every Jira call.
+# The pool holds one connection per worker so none is discarded for being
+# surplus. Rate limits (429, Retry-After honored) and gateway errors are
+# retried with backoff; POST is retried too, as issue search is a read-only POST.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.auth = HTTPBasicAuth(JIRA_EMAIL, JIRA_API_TOKEN)
+SESSION.mount('https://', HTTPAdapter(
+    pool_maxsize=MAX_WORKERS,
+    max_retries=Retry(
+        total=6,
+        backoff_factor=1,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=['GET', 'POST'],
+        raise_on_status=False
+    )
+))
+
+# Issue fields requested from search; every one is read when building a row.
+# Jira returns only the listed fields, so nothing else (description, comments,
+# changelog) is sent or decoded.
+ISSUE_FIELDS = (
+    'assignee', 'summary', 'status', 'created', 'duedate', 'resolutiondate',
+    'statuscategorychangedate', 'issuetype', 'priority', 'updated', 'labels', 'parent'
+)
+
+# Set JIRA_DEBUG_DICT_ROWS=1 to write report rows as column-name dicts through
+# csv.DictWriter; the default positional csv.writer path skips per-cell lookups
+DEBUG_DICT_ROWS = os.getenv('JIRA_DEBUG_DICT_ROWS') == '1'
+
+# CSV columns, in report order
+FIELDNAMES = (
+    'assignee_name', 'project_name', 'issue_key', 'issue_summary', 'issue_type', 'status', 'priority',
+    'created_date', 'start_date', 'due_date', 'resolved_date', 'is_closed', 'last_updated', 'labels',
+    'parent_summary', 'remarks', 'time_to_resolve_days', 'delay_days', 'sla_met'
+)
+
+# Any non-ASCII run (emojis included) stripped from text fields
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7f]+')
+
+# Python 3.11+ parses Jira's 'Z' and +HHMM suffixes natively in fromisoformat
+_NATIVE_ISO_PARSING = sys.version_info >= (3, 11)
+_TZ_OFFSET_RE = re.compile(r'([+-]\d{2}):?(\d{2})$')
+
+# --------------------------- Utility Functions --------------------------- #
+
+def get_projects():
+    """Fetch all Jira projects."""
+    url = f'https://{JIRA_DOMAIN}/rest/api/3/project/search'
+    response = SESSION.get(url)
+    response.raise_for_status()
+    data = json_loads(response.content)
+    return [{'key': p['key'], 'name': p['name']} for p in data.get('values', [])]
+
+@lru_cache(maxsize=4096)  # created/updated timestamps repeat across issues
+def parse_jira_date(date_str):
+    """Convert Jira datetime string to naive Python datetime."""
+    if not date_str:
+        return None
+    try:
+        if not _NATIVE_ISO_PARSING:
+            # Older fromisoformat needs 'Z' and +HHMM spelled as +HH:MM
+            if date_str.endswith('Z'):
+                date_str = date_str[:-1] + '+00:00'
+            date_str = _TZ_OFFSET_RE.sub(r'\1:\2', date_str)
+        # Accepts 'Z', +HHMM and -HHMM suffixes alike; the timezone is dropped to
+        # keep naive datetimes comparable with plain due dates
+        return datetime.fromisoformat(date_str).replace(tzinfo=None)
+    except ValueError as e:
+        print(f"Error parsing date '{date_str}': {e}")
+        return None
+
+def date_to_str(dt):
+    """Convert parsed datetime to YYYY-MM-DD string."""
+    return dt.date().isoformat() if dt else ''
+
+def format_date(date_str):
+    """Convert Jira date to YYYY-MM-DD string."""
+    return date_to_str(parse_jira_date(date_str))
+
+def remove_emojis(text):
+    """Remove emojis and non-ASCII characters."""
+    if not text:
+        return ''
+    # Most fields are already plain ASCII; skip the regex pass for them
+    return text if text.isascii() else _NON_ASCII_RE.sub('', text)
+
+@lru_cache(maxsize=1024)
+def remove_emojis_cached(text):
+    """remove_emojis for low-cardinality fields (assignee, type, status, priority) that repeat across issues."""
+    return remove_emojis(text)
+
+def compute_metrics(created, resolved, due):
+    """Compute time to resolve and SLA metrics as (time_to_resolve_days, delay_days, sla_met)."""
+    try:
+        if not resolved:
+            return '', '', 'N/A'
+        time_to_resolve = (resolved - created).days if created else ''
+        if not due:
+            return time_to_resolve, '', 'N/A'
+        return time_to_resolve, (resolved - due).days, 'Yes' if resolved <= due else 'No'
+    except Exception as e:
+        print(f"Error computing metrics: {e}")
+        return '', '', 'N/A'
+
+def fetch_search_page(url, body):
+    """Fetch one page of search results."""
+    response = SESSION.post(url, json=body)
+    response.raise_for_status()
+    return json_loads(response.content)
+
+# --------------------------- Issue Extraction --------------------------- #
+
+def iter_search_pages(jql):
+    """Yield raw search result pages for a JQL query, following nextPageToken cursors."""
+    url = f'https://{JIRA_DOMAIN}/rest/api/3/search/jql'
+    body = {
+        'jql': jql,
+        'fields': ISSUE_FIELDS,
+        'maxResults': 100
+    }
+
+    # Token pagination costs the same for every page, unlike deep startAt offsets
+    while True:
+        page = fetch_search_page(url, body)
+        yield page
+        token = page.get('nextPageToken')
+        if not token or page.get('isLast'):
+            break
+        body['nextPageToken'] = token
+
+def iter_project_issues(project_key):
+    """Yield pages of raw issues for a project.
+
+    One cursor per project, walked serially: concurrency comes from fetching
+    several projects at once.
+    """
+    for page in iter_search_pages(f'project={project_key}'):
+        yield page.get('issues', [])
+
+def build_task_row(issue, project_name):
+    """Build one report row, as a tuple in FIELDNAMES order, from a raw Jira issue.
+
+    project_name is expected to be already cleaned with remove_emojis.
+    """
+    fields = issue.get('fields', {})
+    assignee = fields.get('assignee') or {}
+
+    parent_field = fields.get('parent')
+    parent_summary = parent_field['fields']['summary'] if parent_field and 'fields' in parent_field else ''
+
+    # Dates parsed once and reused for metrics
+    raw_resolved = fields.get('resolutiondate')
+    created = parse_jira_date(fields.get('created'))
+    resolved = parse_jira_date(raw_resolved)
+    due = parse_jira_date(fields.get('duedate'))
+
+    # Positional row in FIELDNAMES order
+    return (
+        remove_emojis_cached(assignee.get('displayName')),
+        project_name,
+        issue.get('key'),  # Jira keys are always ASCII (PROJ-123), no stripping needed
+        remove_emojis(fields.get('summary')),
+        remove_emojis_cached(fields.get('issuetype', {}).get('name')),
+        remove_emojis_cached(fields.get('status', {}).get('name')),
+        remove_emojis_cached(fields.get('priority', {}).get('name')),
+        date_to_str(created),
+        format_date(fields.get('statuscategorychangedate')),
+        date_to_str(due),
+        date_to_str(resolved),
+        bool(raw_resolved),  # ✅ Closed if resolutiondate exists
+        format_date(fields.get('updated')),
+        remove_emojis(', '.join(fields.get('labels', []))),
+        remove_emojis(parent_summary),
+        '',
+        *compute_metrics(created, resolved, due)
+    )
+
+def empty_task_row(project_name):
+    """Placeholder row for a project without any assigned issues."""
+    task = dict.fromkeys(FIELDNAMES, '')
+    task['project_name'] = remove_emojis(project_name)
+    task['remarks'] = 'No task/epic created'
+    return tuple(task.values())
+
+def task_as_dict(task):
+    """Map a positional row back to column names."""
+    return dict(zip(FIELDNAMES, task))
+
+def report_row_writer(csvfile, **fmtparams):
+    """Write the report header and return a function that writes a batch of rows."""
+    if DEBUG_DICT_ROWS:
+        writer = csv.DictWriter(csvfile, fieldnames=FIELDNAMES, **fmtparams)
+        writer.writeheader()
+        return lambda tasks: writer.writerows(task_as_dict(task) for task in tasks)
+    writer = csv.writer(csvfile, **fmtparams)
+    writer.writerow(FIELDNAMES)
+    return writer.writerows
+
+def get_project_issues(project_key, project_name):
+    """Fetch issues for a specific project and return rows for the assigned ones."""
+    # Same value on every row of the project, so clean it once up front
+    project_name = remove_emojis(project_name)
+    return [
+        build_task_row(issue, project_name)
+        for issues in iter_project_issues(project_key)
+        for issue in issues
+        if issue.get('fields', {}).get('assignee')
+    ]
+
+# --------------------------- Report Export --------------------------- #
+
+def iter_project_tasks(projects, messages):
+    """Fetch all projects concurrently, yielding each project's tasks as it completes.
+
+    messages['failed'] is formatted with name/error, messages['processed'] with
+    name/key/count.
+    """
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {executor.submit(get_project_issues, p['key'], p['name']): p for p in projects}
+        for future in as_completed(futures):
+            # Drop our reference so finished results can be freed once written
+            project = futures.pop(future)
+            try:
+                tasks = future.result()
+            except Exception as e:
+                print(messages['failed'].format(name=project['name'], error=e))
+                continue
+
+            print(messages['processed'].format(name=project['name'], key=project['key'], count=len(tasks)))
+
+            if not tasks:
+                tasks.append(empty_task_row(project['name']))
+            yield tasks
+
+def export_combined_csv(task_batches, filename, messages, **fmtparams):
+    """Stream batches of tasks into filename; returns False if nothing was written.
+
+    Rows go to a temp file that replaces the report only once at least one row
+    was written, so a run where every fetch fails (or one that dies midway)
+    keeps the previous report and leaves no temp file behind.
+    """
+    tmp_filename = filename + '.tmp'
+    total = 0
+    try:
+        with open(tmp_filename, 'w', newline='', encoding='utf-8') as csvfile:
+            write_rows = report_row_writer(csvfile, **fmtparams)
+            for tasks in task_batches:
+                write_rows(tasks)
+                total += len(tasks)
+        print(messages['total'].format(count=total))
+        if total:
+            os.replace(tmp_filename, filename)
+    finally:
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+
+    if not total:
+        print(messages['skipped'])
+        return False
+    print(messages['exported'].format(filename=filename))
+    return True